@@ -14,7 +14,6 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import asyncio
 import json
 import logging
 import os
@@ -29,6 +28,12 @@ from graphiti_core.nodes import EpisodeType
 from graphiti_core.utils.bulk_utils import RawEpisode
 from graphiti_core.utils.maintenance.graph_data_operations import clear_data
 
+try:
+    # uvloop is an optional, faster drop-in replacement for the default asyncio event loop
+    from uvloop import run as run_event_loop
+except ImportError:
+    from asyncio import run as run_event_loop  # type: ignore[assignment]
+
 load_dotenv()
 
 neo4j_uri = os.environ.get('NEO4J_URI', 'bolt://localhost:7687')
@@ -120,4 +125,4 @@ async def ingest_products_data(client: Graphiti):
         )
 
 
-asyncio.run(main())
+run_event_loop(main())
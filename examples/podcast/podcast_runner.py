@@ -14,7 +14,6 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import asyncio
 import logging
 import os
 import sys
@@ -26,6 +25,12 @@ from transcript_parser import parse_podcast_messages
 from graphiti_core import Graphiti
 from graphiti_core.utils.maintenance.graph_data_operations import clear_data
 
+try:
+    # uvloop is an optional, faster drop-in replacement for the default asyncio event loop
+    from uvloop import run as run_event_loop
+except ImportError:
+    from asyncio import run as run_event_loop  # type: ignore[assignment]
+
 load_dotenv()
 
 neo4j_uri = os.environ.get('NEO4J_URI') or 'bolt://localhost:7687'
@@ -80,4 +85,4 @@ async def main():
         )
 
 
-asyncio.run(main())
+run_event_loop(main())
@@ -14,7 +14,6 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import asyncio
 import logging
 import os
 import sys
@@ -28,6 +27,12 @@ from graphiti_core.llm_client.anthropic_client import AnthropicClient
 from graphiti_core.llm_client.config import LLMConfig
 from graphiti_core.utils.maintenance.graph_data_operations import clear_data
 
+try:
+    # uvloop is an optional, faster drop-in replacement for the default asyncio event loop
+    from uvloop import run as run_event_loop
+except ImportError:
+    from asyncio import run as run_event_loop  # type: ignore[assignment]
+
 load_dotenv()
 
 neo4j_uri = os.environ.get('NEO4J_URI') or 'bolt://localhost:7687'
@@ -90,4 +95,4 @@ async def main():
         )
 
 
-asyncio.run(main())
+run_event_loop(main())
@@ -58,7 +58,7 @@ class Edge(BaseModel, ABC):
             database_=DEFAULT_DATABASE,
         )
 
-        logger.debug(f'Deleted Edge: {self.uuid}')
+        logger.debug('Deleted Edge: %s', self.uuid)
 
         return result
 
@@ -86,7 +86,7 @@ class EpisodicEdge(Edge):
             database_=DEFAULT_DATABASE,
         )
 
-        logger.debug(f'Saved edge to neo4j: {self.uuid}')
+        logger.debug('Saved edge to neo4j: %s', self.uuid)
 
         return result
 
@@ -115,6 +115,9 @@ class EpisodicEdge(Edge):
 
     @classmethod
     async def get_by_uuids(cls, driver: AsyncDriver, uuids: list[str]):
+        if len(uuids) == 0:
+            return []
+
         records, _, _ = await driver.execute_query(
             """
         MATCH (n:Episodic)-[e:MENTIONS]->(m:Entity)
@@ -203,7 +206,7 @@ class EntityEdge(Edge):
         self.fact_embedding = await embedder.create(input_data=[text])
 
         end = time()
-        logger.debug(f'embedded {text} in {end - start} ms')
+        logger.debug('embedded %s in %s ms', text, end - start)
 
         return self.fact_embedding
 
@@ -225,7 +228,7 @@ class EntityEdge(Edge):
             database_=DEFAULT_DATABASE,
         )
 
-        logger.debug(f'Saved edge to neo4j: {self.uuid}')
+        logger.debug('Saved edge to neo4j: %s', self.uuid)
 
         return result
 
@@ -261,6 +264,9 @@ class EntityEdge(Edge):
 
     @classmethod
     async def get_by_uuids(cls, driver: AsyncDriver, uuids: list[str]):
+        if len(uuids) == 0:
+            return []
+
         records, _, _ = await driver.execute_query(
             """
         MATCH (n:Entity)-[e:RELATES_TO]->(m:Entity)
@@ -376,7 +382,7 @@ class CommunityEdge(Edge):
             database_=DEFAULT_DATABASE,
         )
 
-        logger.debug(f'Saved edge to neo4j: {self.uuid}')
+        logger.debug('Saved edge to neo4j: %s', self.uuid)
 
         return result
 
@@ -403,6 +409,9 @@ class CommunityEdge(Edge):
 
     @classmethod
     async def get_by_uuids(cls, driver: AsyncDriver, uuids: list[str]):
+        if len(uuids) == 0:
+            return []
+
         records, _, _ = await driver.execute_query(
             """
         MATCH (n:Community)-[e:HAS_MEMBER]->(m:Entity | Community)
@@ -15,6 +15,7 @@ limitations under the License.
 """
 
 import logging
+from collections.abc import Hashable
 from datetime import datetime
 from time import time
 
@@ -31,6 +32,7 @@ from graphiti_core.helpers import DEFAULT_DATABASE, semaphore_gather
 from graphiti_core.llm_client import LLMClient, OpenAIClient
 from graphiti_core.nodes import CommunityNode, EntityNode, EpisodeType, EpisodicNode
 from graphiti_core.search.search import SearchConfig, search
+from graphiti_core.search.search_cache import SearchCache
 from graphiti_core.search.search_config import DEFAULT_SEARCH_LIMIT, SearchResults
 from graphiti_core.search.search_config_recipes import (
     EDGE_HYBRID_SEARCH_NODE_DISTANCE,
@@ -57,7 +59,7 @@ from graphiti_core.utils.datetime_utils import utc_now
 from graphiti_core.utils.maintenance.community_operations import (
     build_communities,
     remove_communities,
-    update_community,
+    update_entity_communities,
 )
 from graphiti_core.utils.maintenance.edge_operations import (
     build_episodic_edges,
@@ -98,6 +100,7 @@ class Graphiti:
         embedder: EmbedderClient | None = None,
         cross_encoder: CrossEncoderClient | None = None,
         store_raw_episode_content: bool = True,
+        search_cache: SearchCache | None = None,
     ):
         """
         Initialize a Graphiti instance.
@@ -116,6 +119,11 @@ class Graphiti:
         llm_client : LLMClient | None, optional
             An instance of LLMClient for natural language processing tasks.
             If not provided, a default OpenAIClient will be initialized.
+        search_cache : SearchCache | None, optional
+            An optional in-memory cache for search and episode lookup results. If provided,
+            repeated reads are served from the cache until the graph is written to or the
+            entry expires.
+            Cached results are keyed on graph_version, which is incremented on every write.
 
         Returns
         -------
@@ -150,6 +158,8 @@ class Graphiti:
             self.cross_encoder = cross_encoder
         else:
             self.cross_encoder = OpenAIRerankerClient()
+        self.search_cache = search_cache
+        self.graph_version = 0
 
     async def close(self):
         """
@@ -183,6 +193,10 @@ class Graphiti:
         """
         await self.driver.close()
 
+    def _increment_graph_version(self):
+        # Cached search results are keyed on the graph version, so bumping it invalidates them
+        self.graph_version += 1
+
     async def build_indices_and_constraints(self, delete_existing: bool = False):
         """
         Build indices and constraints in the Neo4j database.
@@ -315,14 +329,11 @@ class Graphiti:
             entity_edges: list[EntityEdge] = []
             now = utc_now()
 
-            previous_episodes = await self.retrieve_episodes(
-                reference_time, last_n=RELEVANT_SCHEMA_LIMIT, group_ids=[group_id]
-            )
+            async def get_or_create_episode() -> EpisodicNode:
+                if uuid is not None:
+                    return await EpisodicNode.get_by_uuid(self.driver, uuid)
 
-            episode = (
-                await EpisodicNode.get_by_uuid(self.driver, uuid)
-                if uuid is not None
-                else EpisodicNode(
+                return EpisodicNode(
                     name=name,
                     group_id=group_id,
                     labels=[],
@@ -332,6 +343,13 @@ class Graphiti:
                     created_at=now,
                     valid_at=reference_time,
                 )
+
+            # The previous episodes and the episode itself are independent reads
+            previous_episodes, episode = await semaphore_gather(
+                self.retrieve_episodes(
+                    reference_time, last_n=RELEVANT_SCHEMA_LIMIT, group_ids=[group_id]
+                ),
+                get_or_create_episode(),
             )
 
             # Extract entities as nodes
@@ -339,27 +357,31 @@ class Graphiti:
             extracted_nodes = await extract_nodes(
                 self.llm_client, episode, previous_episodes, entity_types
             )
-            logger.debug(f'Extracted nodes: {[(n.name, n.uuid) for n in extracted_nodes]}')
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('Extracted nodes: %s', [(n.name, n.uuid) for n in extracted_nodes])
 
-            # Calculate Embeddings
+            # Calculate embeddings and find relevant nodes already in the graph. Each node's
+            # lookup starts as soon as its own embedding is ready rather than after all of them
+            async def embed_and_get_relevant_nodes(node: EntityNode) -> list[EntityNode]:
+                await node.generate_name_embedding(self.embedder)
+                return await get_relevant_nodes(self.driver, SearchFilters(), [node])
 
-            await semaphore_gather(
-                *[node.generate_name_embedding(self.embedder) for node in extracted_nodes]
-            )
-
-            # Find relevant nodes already in the graph
             existing_nodes_lists: list[list[EntityNode]] = list(
                 await semaphore_gather(
-                    *[
-                        get_relevant_nodes(self.driver, SearchFilters(), [node])
-                        for node in extracted_nodes
-                    ]
+                    *[embed_and_get_relevant_nodes(node) for node in extracted_nodes]
                 )
             )
 
-            # Resolve extracted nodes with nodes already in the graph and extract facts
-            logger.debug(f'Extracted nodes: {[(n.name, n.uuid) for n in extracted_nodes]}')
+            # Edge embeddings only depend on the fact text, so they are generated as soon as
+            # the edges are extracted, while the extracted nodes are still being resolved
+            async def extract_and_embed_edges() -> list[EntityEdge]:
+                edges = await extract_edges(
+                    self.llm_client, episode, extracted_nodes, previous_episodes, group_id
+                )
+                await semaphore_gather(*[edge.generate_embedding(self.embedder) for edge in edges])
+                return edges
 
+            # Resolve extracted nodes with nodes already in the graph and extract facts
             (mentioned_nodes, uuid_map), extracted_edges = await semaphore_gather(
                 resolve_extracted_nodes(
                     self.llm_client,
@@ -369,27 +391,23 @@ class Graphiti:
                     previous_episodes,
                     entity_types,
                 ),
-                extract_edges(
-                    self.llm_client, episode, extracted_nodes, previous_episodes, group_id
-                ),
+                extract_and_embed_edges(),
             )
-            logger.debug(f'Adjusted mentioned nodes: {[(n.name, n.uuid) for n in mentioned_nodes]}')
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    'Adjusted mentioned nodes: %s', [(n.name, n.uuid) for n in mentioned_nodes]
+                )
             nodes = mentioned_nodes
 
             extracted_edges_with_resolved_pointers = resolve_edge_pointers(
                 extracted_edges, uuid_map
             )
 
-            # calculate embeddings
-            await semaphore_gather(
-                *[
-                    edge.generate_embedding(self.embedder)
-                    for edge in extracted_edges_with_resolved_pointers
-                ]
-            )
-
-            # Resolve extracted edges with related edges already in the graph
-            related_edges_list: list[list[EntityEdge]] = list(
+            # Resolve extracted edges with related edges already in the graph. Each edge's
+            # related, source and target edge searches are independent, so all of them go
+            # through a single gather to keep the number of concurrent queries bounded
+            edges_count = len(extracted_edges_with_resolved_pointers)
+            edge_search_results: list[list[EntityEdge]] = list(
                 await semaphore_gather(
                     *[
                         get_relevant_edges(
@@ -400,45 +418,37 @@ class Graphiti:
                             RELEVANT_SCHEMA_LIMIT,
                         )
                         for edge in extracted_edges_with_resolved_pointers
-                    ]
-                )
-            )
-            logger.debug(
-                f'Related edges lists: {[(e.name, e.uuid) for edges_lst in related_edges_list for e in edges_lst]}'
-            )
-            logger.debug(
-                f'Extracted edges: {[(e.name, e.uuid) for e in extracted_edges_with_resolved_pointers]}'
-            )
-
-            existing_source_edges_list: list[list[EntityEdge]] = list(
-                await semaphore_gather(
+                    ],
                     *[
                         get_relevant_edges(
-                            self.driver,
-                            [edge],
-                            edge.source_node_uuid,
-                            None,
-                            RELEVANT_SCHEMA_LIMIT,
+                            self.driver, [edge], edge.source_node_uuid, None, RELEVANT_SCHEMA_LIMIT
                         )
                         for edge in extracted_edges_with_resolved_pointers
-                    ]
-                )
-            )
-
-            existing_target_edges_list: list[list[EntityEdge]] = list(
-                await semaphore_gather(
+                    ],
                     *[
                         get_relevant_edges(
-                            self.driver,
-                            [edge],
-                            None,
-                            edge.target_node_uuid,
-                            RELEVANT_SCHEMA_LIMIT,
+                            self.driver, [edge], None, edge.target_node_uuid, RELEVANT_SCHEMA_LIMIT
                         )
                         for edge in extracted_edges_with_resolved_pointers
-                    ]
+                    ],
                 )
             )
+            related_edges_list: list[list[EntityEdge]] = edge_search_results[:edges_count]
+            existing_source_edges_list: list[list[EntityEdge]] = edge_search_results[
+                edges_count : 2 * edges_count
+            ]
+            existing_target_edges_list: list[list[EntityEdge]] = edge_search_results[
+                2 * edges_count :
+            ]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    'Related edges lists: %s',
+                    [(e.name, e.uuid) for edges_lst in related_edges_list for e in edges_lst],
+                )
+                logger.debug(
+                    'Extracted edges: %s',
+                    [(e.name, e.uuid) for e in extracted_edges_with_resolved_pointers],
+                )
 
             existing_edges_list: list[list[EntityEdge]] = [
                 source_lst + target_lst
@@ -458,11 +468,12 @@ class Graphiti:
 
             entity_edges.extend(resolved_edges + invalidated_edges)
 
-            logger.debug(f'Resolved edges: {[(e.name, e.uuid) for e in resolved_edges]}')
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('Resolved edges: %s', [(e.name, e.uuid) for e in resolved_edges])
 
             episodic_edges: list[EpisodicEdge] = build_episodic_edges(mentioned_nodes, episode, now)
 
-            logger.debug(f'Built episodic edges: {episodic_edges}')
+            logger.debug('Built episodic edges: %s', episodic_edges)
 
             episode.entity_edges = [edge.uuid for edge in entity_edges]
 
@@ -472,17 +483,14 @@ class Graphiti:
             await add_nodes_and_edges_bulk(
                 self.driver, [episode], episodic_edges, nodes, entity_edges
             )
+            self._increment_graph_version()
 
             # Update any communities
             if update_communities:
-                await semaphore_gather(
-                    *[
-                        update_community(self.driver, self.llm_client, self.embedder, node)
-                        for node in nodes
-                    ]
-                )
+                await update_entity_communities(self.driver, self.llm_client, self.embedder, nodes)
+                self._increment_graph_version()
             end = time()
-            logger.info(f'Completed add_episode in {(end - start) * 1000} ms')
+            logger.info('Completed add_episode in %s ms', (end - start) * 1000)
 
             return AddEpisodeResults(episode=episode, nodes=nodes, edges=entity_edges)
 
@@ -545,8 +553,8 @@ class Graphiti:
                 for episode in bulk_episodes
             ]
 
-            # Save all the episodes
-            await semaphore_gather(*[episode.save(self.driver) for episode in episodes])
+            # Save all the episodes in a single transaction
+            await add_nodes_and_edges_bulk(self.driver, episodes, [], [], [])
 
             # Get previous episode context for each episode
             episode_pairs = await retrieve_previous_episodes_bulk(self.driver, episodes)
@@ -570,9 +578,6 @@ class Graphiti:
                 extract_edge_dates_bulk(self.llm_client, extracted_edges, episode_pairs),
             )
 
-            # save nodes to KG
-            await semaphore_gather(*[node.save(self.driver) for node in nodes])
-
             # re-map edge pointers so that they don't point to discard dupe nodes
             extracted_edges_with_resolved_pointers: list[EntityEdge] = resolve_edge_pointers(
                 extracted_edges_timestamped, uuid_map
@@ -581,24 +586,22 @@ class Graphiti:
                 episodic_edges, uuid_map
             )
 
-            # save episodic edges to KG
-            await semaphore_gather(
-                *[edge.save(self.driver) for edge in episodic_edges_with_resolved_pointers]
-            )
-
             # Dedupe extracted edges
             edges = await dedupe_edges_bulk(
                 self.driver, self.llm_client, extracted_edges_with_resolved_pointers
             )
-            logger.debug(f'extracted edge length: {len(edges)}')
+            logger.debug('extracted edge length: %s', len(edges))
 
             # invalidate edges
 
-            # save edges to KG
-            await semaphore_gather(*[edge.save(self.driver) for edge in edges])
+            # save nodes, episodic edges and entity edges to KG in a single transaction
+            await add_nodes_and_edges_bulk(
+                self.driver, [], episodic_edges_with_resolved_pointers, nodes, edges
+            )
+            self._increment_graph_version()
 
             end = time()
-            logger.info(f'Completed add_episode_bulk in {(end - start) * 1000} ms')
+            logger.info('Completed add_episode_bulk in %s ms', (end - start) * 1000)
 
         except Exception as e:
             raise e
@@ -624,6 +627,7 @@ class Graphiti:
 
         await semaphore_gather(*[node.save(self.driver) for node in community_nodes])
         await semaphore_gather(*[edge.save(self.driver) for edge in community_edges])
+        self._increment_graph_version()
 
         return community_nodes
 
@@ -671,6 +675,23 @@ class Graphiti:
         )
         search_config.limit = num_results
 
+        search_filter = search_filter if search_filter is not None else SearchFilters()
+        # The cache is opt-in, so only pay for building the key when it is enabled
+        cache_key: Hashable | None = None
+        if self.search_cache is not None:
+            cache_key = (
+                'search',
+                self.graph_version,
+                query,
+                tuple(group_ids) if group_ids else None,
+                center_node_uuid,
+                num_results,
+                search_filter.model_dump_json(),
+            )
+            cached_edges = self.search_cache.get(cache_key)
+            if cached_edges is not None:
+                return [edge.model_copy(deep=True) for edge in cached_edges]
+
         edges = (
             await search(
                 self.driver,
@@ -679,11 +700,14 @@ class Graphiti:
                 query,
                 group_ids,
                 search_config,
-                search_filter if search_filter is not None else SearchFilters(),
+                search_filter,
                 center_node_uuid,
             )
         ).edges
 
+        if self.search_cache is not None and cache_key is not None:
+            self.search_cache.set(cache_key, [edge.model_copy(deep=True) for edge in edges])
+
         return edges
 
     async def _search(
@@ -695,19 +719,48 @@ class Graphiti:
         bfs_origin_node_uuids: list[str] | None = None,
         search_filter: SearchFilters | None = None,
     ) -> SearchResults:
-        return await search(
+        search_filter = search_filter if search_filter is not None else SearchFilters()
+        cache_key: Hashable | None = None
+        if self.search_cache is not None:
+            cache_key = (
+                '_search',
+                self.graph_version,
+                query,
+                config.model_dump_json(),
+                tuple(group_ids) if group_ids else None,
+                center_node_uuid,
+                tuple(bfs_origin_node_uuids) if bfs_origin_node_uuids is not None else None,
+                search_filter.model_dump_json(),
+            )
+            cached_results = self.search_cache.get(cache_key)
+            if cached_results is not None:
+                return cached_results.model_copy(deep=True)
+
+        results = await search(
             self.driver,
             self.embedder,
             self.cross_encoder,
             query,
             group_ids,
             config,
-            search_filter if search_filter is not None else SearchFilters(),
+            search_filter,
             center_node_uuid,
             bfs_origin_node_uuids,
         )
 
+        if self.search_cache is not None and cache_key is not None:
+            self.search_cache.set(cache_key, results.model_copy(deep=True))
+
+        return results
+
     async def get_nodes_and_edges_by_episode(self, episode_uuids: list[str]) -> SearchResults:
+        cache_key: Hashable | None = None
+        if self.search_cache is not None:
+            cache_key = ('get_nodes_and_edges_by_episode', self.graph_version, tuple(episode_uuids))
+            cached_results = self.search_cache.get(cache_key)
+            if cached_results is not None:
+                return cached_results.model_copy(deep=True)
+
         episodes = await EpisodicNode.get_by_uuids(self.driver, episode_uuids)
 
         edges_list = await semaphore_gather(
@@ -718,23 +771,35 @@ class Graphiti:
 
         nodes = await get_mentioned_nodes(self.driver, episodes)
 
-        return SearchResults(edges=edges, nodes=nodes, communities=[])
+        results = SearchResults(edges=edges, nodes=nodes, communities=[])
+
+        if self.search_cache is not None and cache_key is not None:
+            self.search_cache.set(cache_key, results.model_copy(deep=True))
+
+        return results
 
     async def add_triplet(self, source_node: EntityNode, edge: EntityEdge, target_node: EntityNode):
-        if source_node.name_embedding is None:
-            await source_node.generate_name_embedding(self.embedder)
-        if target_node.name_embedding is None:
-            await target_node.generate_name_embedding(self.embedder)
-        if edge.fact_embedding is None:
-            await edge.generate_embedding(self.embedder)
+        # Embeddings and relevant node lookups are independent, so run them concurrently
+        await semaphore_gather(
+            *[
+                node.generate_name_embedding(self.embedder)
+                for node in [source_node, target_node]
+                if node.name_embedding is None
+            ],
+            *([edge.generate_embedding(self.embedder)] if edge.fact_embedding is None else []),
+        )
+
+        existing_nodes_lists: list[list[EntityNode]] = list(
+            await semaphore_gather(
+                get_relevant_nodes(self.driver, SearchFilters(), [source_node]),
+                get_relevant_nodes(self.driver, SearchFilters(), [target_node]),
+            )
+        )
 
         resolved_nodes, uuid_map = await resolve_extracted_nodes(
             self.llm_client,
             [source_node, target_node],
-            [
-                await get_relevant_nodes(self.driver, SearchFilters(), [source_node]),
-                await get_relevant_nodes(self.driver, SearchFilters(), [target_node]),
-            ],
+            existing_nodes_lists,
         )
 
         updated_edge = resolve_edge_pointers([edge], uuid_map)[0]
@@ -754,6 +819,7 @@ class Graphiti:
         await add_nodes_and_edges_bulk(
             self.driver, [], [], resolved_nodes, [resolved_edge] + invalidated_edges
         )
+        self._increment_graph_version()
 
     async def remove_episode(self, episode_uuid: str):
         # Find the episode to be deleted
@@ -785,3 +851,4 @@ class Graphiti:
         await semaphore_gather(*[node.delete(self.driver) for node in nodes_to_delete])
         await semaphore_gather(*[edge.delete(self.driver) for edge in edges_to_delete])
         await episode.delete(self.driver)
+        self._increment_graph_version()
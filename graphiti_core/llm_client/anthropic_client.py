@@ -14,9 +14,9 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import json
 import logging
 import typing
+from typing import ClassVar
 
 import anthropic
 from anthropic import AsyncAnthropic
@@ -26,6 +26,7 @@ from ..prompts.models import Message
 from .client import LLMClient
 from .config import LLMConfig
 from .errors import RateLimitError
+from .utils import parse_json_response
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +35,8 @@ DEFAULT_MAX_TOKENS = 8192
 
 
 class AnthropicClient(LLMClient):
+    supports_structured_output: ClassVar[bool] = True
+
     def __init__(self, config: LLMConfig | None = None, cache: bool = False):
         if config is None:
             config = LLMConfig(max_tokens=DEFAULT_MAX_TOKENS)
@@ -54,21 +57,44 @@ class AnthropicClient(LLMClient):
         max_tokens: int = DEFAULT_MAX_TOKENS,
     ) -> dict[str, typing.Any]:
         system_message = messages[0]
-        user_messages = [{'role': m.role, 'content': m.content} for m in messages[1:]] + [
-            {'role': 'assistant', 'content': '{'}
-        ]
+        user_messages = [{'role': m.role, 'content': m.content} for m in messages[1:]]
 
         try:
+            if response_model is not None:
+                # Force a tool call whose input schema is the response model, so the model
+                # returns structured JSON natively instead of text we have to parse
+                result = await self.client.messages.create(
+                    system=system_message.content,
+                    max_tokens=max_tokens or self.max_tokens,
+                    temperature=self.temperature,
+                    messages=user_messages,  # type: ignore
+                    model=self.model or DEFAULT_MODEL,
+                    tools=[
+                        {
+                            'name': response_model.__name__,
+                            'description': f'Respond with a {response_model.__name__} object',
+                            'input_schema': response_model.model_json_schema(),
+                        }
+                    ],
+                    tool_choice={'type': 'tool', 'name': response_model.__name__},
+                )
+
+                for content_block in result.content:
+                    if content_block.type == 'tool_use':
+                        return content_block.input  # type: ignore
+
+                raise Exception(f'Invalid response from LLM: {result.model_dump()}')
+
             result = await self.client.messages.create(
                 system='Only include JSON in the response. Do not include any additional text or explanation of the content.\n'
                 + system_message.content,
                 max_tokens=max_tokens or self.max_tokens,
                 temperature=self.temperature,
-                messages=user_messages,  # type: ignore
+                messages=user_messages + [{'role': 'assistant', 'content': '{'}],  # type: ignore
                 model=self.model or DEFAULT_MODEL,
             )
 
-            return json.loads('{' + result.content[0].text)  # type: ignore
+            return parse_json_response('{' + result.content[0].text)  # type: ignore
         except anthropic.RateLimitError as e:
             raise RateLimitError from e
         except Exception as e:
@@ -17,8 +17,10 @@ limitations under the License.
 import hashlib
 import json
 import logging
+import re
 import typing
 from abc import ABC, abstractmethod
+from typing import ClassVar
 
 import httpx
 from diskcache import Cache
@@ -34,6 +36,9 @@ DEFAULT_CACHE_DIR = './llm_cache'
 
 logger = logging.getLogger(__name__)
 
+# Zero-width characters and control characters other than newlines, returns, and tabs
+_INVISIBLE_CHARS_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\u200b\u200c\u200d\ufeff\u2060]')
+
 
 def is_server_or_retry_error(exception):
     if isinstance(exception, (RateLimitError, json.decoder.JSONDecodeError)):
@@ -45,6 +50,10 @@ def is_server_or_retry_error(exception):
 
 
 class LLMClient(ABC):
+    # Clients that pass response_model to the provider's native structured output support
+    # don't need the JSON schema spelled out in the prompt
+    supports_structured_output: ClassVar[bool] = False
+
     def __init__(self, config: LLMConfig | None, cache: bool = False):
         if config is None:
             config = LLMConfig()
@@ -54,7 +63,8 @@ class LLMClient(ABC):
         self.temperature = config.temperature
         self.max_tokens = config.max_tokens
         self.cache_enabled = cache
-        self.cache_dir = Cache(DEFAULT_CACHE_DIR)  # Create a cache directory
+        # Opening the cache creates a directory and a SQLite database, so only do it when caching is used
+        self.cache_dir: Cache | None = Cache(DEFAULT_CACHE_DIR) if cache else None
 
     def _clean_input(self, input: str) -> str:
         """Clean input string of invalid unicode and control characters.
@@ -68,13 +78,9 @@ class LLMClient(ABC):
         # Clean any invalid Unicode
         cleaned = input.encode('utf-8', errors='ignore').decode('utf-8')
 
-        # Remove zero-width characters and other invisible unicode
-        zero_width = '\u200b\u200c\u200d\ufeff\u2060'
-        for char in zero_width:
-            cleaned = cleaned.replace(char, '')
-
-        # Remove control characters except newlines, returns, and tabs
-        cleaned = ''.join(char for char in cleaned if ord(char) >= 32 or char in '\n\r\t')
+        # Remove zero-width characters, other invisible unicode, and control characters
+        # except newlines, returns, and tabs
+        cleaned = _INVISIBLE_CHARS_RE.sub('', cleaned)
 
         return cleaned
 
@@ -109,10 +115,17 @@ class LLMClient(ABC):
     ) -> dict[str, typing.Any]:
         pass
 
-    def _get_cache_key(self, messages: list[Message]) -> str:
-        # Create a unique cache key based on the messages and model
+    def _get_cache_key(
+        self, messages: list[Message], response_model: type[BaseModel] | None = None
+    ) -> str:
+        # Create a unique cache key based on the messages, model and response model. Clients
+        # with native structured output don't put the schema in the messages, so it is keyed
+        # on explicitly to keep responses for different response models apart
         message_str = json.dumps([m.model_dump() for m in messages], sort_keys=True)
         key_str = f'{self.model}:{message_str}'
+        if response_model is not None:
+            schema_str = json.dumps(response_model.model_json_schema(), sort_keys=True)
+            key_str += f':{response_model.__name__}:{schema_str}'
         return hashlib.md5(key_str.encode()).hexdigest()
 
     async def generate_response(
@@ -121,7 +134,7 @@ class LLMClient(ABC):
         response_model: type[BaseModel] | None = None,
         max_tokens: int = DEFAULT_MAX_TOKENS,
     ) -> dict[str, typing.Any]:
-        if response_model is not None:
+        if response_model is not None and not self.supports_structured_output:
             serialized_model = json.dumps(response_model.model_json_schema())
             messages[
                 -1
@@ -129,12 +142,12 @@ class LLMClient(ABC):
                 f'\n\nRespond with a JSON object in the following format:\n\n{serialized_model}'
             )
 
-        if self.cache_enabled:
-            cache_key = self._get_cache_key(messages)
+        if self.cache_enabled and self.cache_dir is not None:
+            cache_key = self._get_cache_key(messages, response_model)
 
             cached_response = self.cache_dir.get(cache_key)
             if cached_response is not None:
-                logger.debug(f'Cache hit for {cache_key}')
+                logger.debug('Cache hit for %s', cache_key)
                 return cached_response
 
         for message in messages:
@@ -142,7 +155,7 @@ class LLMClient(ABC):
 
         response = await self._generate_response_with_retry(messages, response_model, max_tokens)
 
-        if self.cache_enabled:
+        if self.cache_enabled and self.cache_dir is not None:
             self.cache_dir.set(cache_key, response)
 
         return response
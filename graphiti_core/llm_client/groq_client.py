@@ -14,7 +14,6 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import json
 import logging
 import typing
 
@@ -27,6 +26,7 @@ from ..prompts.models import Message
 from .client import LLMClient
 from .config import LLMConfig
 from .errors import RateLimitError
+from .utils import parse_json_response
 
 logger = logging.getLogger(__name__)
 
@@ -65,7 +65,7 @@ class GroqClient(LLMClient):
                 response_format={'type': 'json_object'},
             )
             result = response.choices[0].message.content or ''
-            return json.loads(result)
+            return parse_json_response(result)
         except groq.RateLimitError as e:
             raise RateLimitError from e
         except Exception as e:
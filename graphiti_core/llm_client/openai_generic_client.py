@@ -28,6 +28,7 @@ from ..prompts.models import Message
 from .client import LLMClient
 from .config import DEFAULT_MAX_TOKENS, LLMConfig
 from .errors import RateLimitError, RefusalError
+from .utils import parse_json_response
 
 logger = logging.getLogger(__name__)
 
@@ -106,7 +107,7 @@ class OpenAIGenericClient(LLMClient):
                 response_format={'type': 'json_object'},
             )
             result = response.choices[0].message.content or ''
-            return json.loads(result)
+            return parse_json_response(result)
         except openai.RateLimitError as e:
             raise RateLimitError from e
         except Exception as e:
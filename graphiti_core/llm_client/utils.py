@@ -14,13 +14,25 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import json
 import logging
+import re
 from time import time
+from typing import Any
 
 from graphiti_core.embedder.client import EmbedderClient
 
+try:
+    # orjson parses LLM responses several times faster than the stdlib json module. It is not a
+    # dependency of graphiti-core, so it is only used when it has been installed separately
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+_CODE_FENCE_RE = re.compile(r'^```(?:json)?\s*|\s*```$')
+
 
 async def generate_embedding(embedder: EmbedderClient, text: str):
     start = time()
@@ -29,6 +41,62 @@ async def generate_embedding(embedder: EmbedderClient, text: str):
     embedding = await embedder.create(input_data=[text])
 
     end = time()
-    logger.debug(f'embedded text of length {len(text)} in {end - start} ms')
+    logger.debug('embedded text of length %s in %s ms', len(text), end - start)
 
     return embedding
+
+
+def repair_json(text: str) -> str:
+    # Fix the most common ways LLMs produce almost-valid JSON: markdown code fences,
+    # prose around the JSON object, and trailing commas
+    repaired = _CODE_FENCE_RE.sub('', text.strip())
+
+    start = min((i for i in (repaired.find('{'), repaired.find('[')) if i != -1), default=0)
+    end = max(repaired.rfind('}'), repaired.rfind(']')) + 1
+    if end > start:
+        repaired = repaired[start:end]
+
+    return _remove_trailing_commas(repaired)
+
+
+def _remove_trailing_commas(text: str) -> str:
+    # Drop commas directly followed by a closing bracket, skipping over string literals so
+    # that text such as "[a, b, ]" inside a value is left untouched
+    chars: list[str] = []
+    in_string = False
+    escaped = False
+    for i, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == ',':
+            j = i + 1
+            while j < len(text) and text[j].isspace():
+                j += 1
+            if j < len(text) and text[j] in '}]':
+                continue
+
+        chars.append(char)
+
+    return ''.join(chars)
+
+
+def parse_json_response(text: str) -> Any:
+    try:
+        return json_loads(text)
+    except json.JSONDecodeError as e:
+        # Salvaging a nearly valid response is much cheaper than another LLM round trip.
+        # If the repair does not help, raise the original error so the caller can retry.
+        try:
+            result = json_loads(repair_json(text))
+        except json.JSONDecodeError:
+            raise e from None
+
+        logger.debug('Repaired malformed JSON in LLM response')
+        return result
@@ -95,7 +95,7 @@ class Node(BaseModel, ABC):
             database_=DEFAULT_DATABASE,
         )
 
-        logger.debug(f'Deleted Node: {self.uuid}')
+        logger.debug('Deleted Node: %s', self.uuid)
 
         return result
 
@@ -154,7 +154,7 @@ class EpisodicNode(Node):
             database_=DEFAULT_DATABASE,
         )
 
-        logger.debug(f'Saved Node to neo4j: {self.uuid}')
+        logger.debug('Saved Node to neo4j: %s', self.uuid)
 
         return result
 
@@ -187,6 +187,9 @@ class EpisodicNode(Node):
 
     @classmethod
     async def get_by_uuids(cls, driver: AsyncDriver, uuids: list[str]):
+        if len(uuids) == 0:
+            return []
+
         records, _, _ = await driver.execute_query(
             """
         MATCH (e:Episodic) WHERE e.uuid IN $uuids
@@ -264,7 +267,7 @@ class EntityNode(Node):
         text = self.name.replace('\n', ' ')
         self.name_embedding = await embedder.create(input_data=[text])
         end = time()
-        logger.debug(f'embedded {text} in {end - start} ms')
+        logger.debug('embedded %s in %s ms', text, end - start)
 
         return self.name_embedding
 
@@ -287,7 +290,7 @@ class EntityNode(Node):
             database_=DEFAULT_DATABASE,
         )
 
-        logger.debug(f'Saved Node to neo4j: {self.uuid}')
+        logger.debug('Saved Node to neo4j: %s', self.uuid)
 
         return result
 
@@ -320,6 +323,9 @@ class EntityNode(Node):
 
     @classmethod
     async def get_by_uuids(cls, driver: AsyncDriver, uuids: list[str]):
+        if len(uuids) == 0:
+            return []
+
         records, _, _ = await driver.execute_query(
             """
         MATCH (n:Entity) WHERE n.uuid IN $uuids
@@ -399,7 +405,7 @@ class CommunityNode(Node):
             database_=DEFAULT_DATABASE,
         )
 
-        logger.debug(f'Saved Node to neo4j: {self.uuid}')
+        logger.debug('Saved Node to neo4j: %s', self.uuid)
 
         return result
 
@@ -408,7 +414,7 @@ class CommunityNode(Node):
         text = self.name.replace('\n', ' ')
         self.name_embedding = await embedder.create(input_data=[text])
         end = time()
-        logger.debug(f'embedded {text} in {end - start} ms')
+        logger.debug('embedded %s in %s ms', text, end - start)
 
         return self.name_embedding
 
@@ -439,6 +445,9 @@ class CommunityNode(Node):
 
     @classmethod
     async def get_by_uuids(cls, driver: AsyncDriver, uuids: list[str]):
+        if len(uuids) == 0:
+            return []
+
         records, _, _ = await driver.execute_query(
             """
         MATCH (n:Community) WHERE n.uuid IN $uuids
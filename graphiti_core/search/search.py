@@ -125,7 +125,7 @@ async def search(
 
     latency = (time() - start) * 1000
 
-    logger.debug(f'search returned context for query {query} in {latency} ms')
+    logger.debug('search returned context for query %s in %s ms', query, latency)
 
     return results
 
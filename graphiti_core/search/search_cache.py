@@ -0,0 +1,68 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from time import monotonic
+from typing import Any
+
+DEFAULT_SEARCH_CACHE_SIZE = 1024
+DEFAULT_SEARCH_CACHE_TTL = 120
+
+
+class SearchCache:
+    """
+    In-memory LRU cache for search results with a per-entry time-to-live.
+
+    Graphiti includes its graph version in every cache key, so results cached before a write
+    are never served afterwards and simply age out. Writes made outside of the Graphiti
+    instance are not observed, so the ttl bounds how stale a cached result can be.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_SEARCH_CACHE_SIZE,
+        ttl: float = DEFAULT_SEARCH_CACHE_TTL,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        self._entries[key] = (monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -28,7 +28,6 @@ from graphiti_core.helpers import (
     DEFAULT_DATABASE,
     USE_PARALLEL_RUNTIME,
     lucene_sanitize,
-    normalize_l2,
     semaphore_gather,
 )
 from graphiti_core.nodes import (
@@ -91,6 +90,9 @@ async def get_episodes_by_mentions(
 async def get_mentioned_nodes(
     driver: AsyncDriver, episodes: list[EpisodicNode]
 ) -> list[EntityNode]:
+    if len(episodes) == 0:
+        return []
+
     episode_uuids = [episode.uuid for episode in episodes]
     records, _, _ = await driver.execute_query(
         """
@@ -118,6 +120,9 @@ async def get_mentioned_nodes(
 async def get_communities_by_nodes(
     driver: AsyncDriver, nodes: list[EntityNode]
 ) -> list[CommunityNode]:
+    if len(nodes) == 0:
+        return []
+
     node_uuids = [node.uuid for node in nodes]
     records, _, _ = await driver.execute_query(
         """
@@ -279,7 +284,7 @@ async def edge_bfs_search(
     limit: int,
 ) -> list[EntityEdge]:
     # vector similarity search over embedded facts
-    if bfs_origin_node_uuids is None:
+    if bfs_origin_node_uuids is None or len(bfs_origin_node_uuids) == 0:
         return []
 
     filter_query, filter_params = edge_search_filter_query_constructor(search_filter)
@@ -439,7 +444,7 @@ async def node_bfs_search(
     limit: int,
 ) -> list[EntityNode]:
     # vector similarity search over entity names
-    if bfs_origin_node_uuids is None:
+    if bfs_origin_node_uuids is None or len(bfs_origin_node_uuids) == 0:
         return []
 
     filter_query, filter_params = node_search_filter_query_constructor(search_filter)
@@ -631,7 +636,7 @@ async def hybrid_node_search(
     relevant_nodes: list[EntityNode] = [node_uuid_map[uuid] for uuid in ranked_uuids]
 
     end = time()
-    logger.debug(f'Found relevant nodes: {ranked_uuids} in {(end - start) * 1000} ms')
+    logger.debug('Found relevant nodes: %s in %s ms', ranked_uuids, (end - start) * 1000)
     return relevant_nodes
 
 
@@ -712,7 +717,7 @@ async def get_relevant_edges(
             relevant_edges.append(edge)
 
     end = time()
-    logger.debug(f'Found relevant edges: {relevant_edge_uuids} in {(end - start) * 1000} ms')
+    logger.debug('Found relevant edges: %s in %s ms', relevant_edge_uuids, (end - start) * 1000)
 
     return relevant_edges
 
@@ -739,6 +744,9 @@ async def node_distance_reranker(
     filtered_uuids = list(filter(lambda node_uuid: node_uuid != center_node_uuid, node_uuids))
     scores: dict[str, float] = {center_node_uuid: 0.0}
 
+    if len(filtered_uuids) == 0:
+        return [center_node_uuid] if center_node_uuid in node_uuids else []
+
     # Find the shortest path to center node
     query = Query("""
         UNWIND $node_uuids AS node_uuid
@@ -777,6 +785,9 @@ async def episode_mentions_reranker(driver: AsyncDriver, node_uuids: list[list[s
     sorted_uuids = rrf(node_uuids)
     scores: dict[str, float] = {}
 
+    if len(sorted_uuids) == 0:
+        return []
+
     # Find the shortest path to center node
     query = Query("""
         UNWIND $node_uuids AS node_uuid 
@@ -803,13 +814,28 @@ def maximal_marginal_relevance(
     query_vector: list[float],
     candidates: list[tuple[str, list[float]]],
     mmr_lambda: float = DEFAULT_MMR_LAMBDA,
-):
-    candidates_with_mmr: list[tuple[str, float]] = []
-    for candidate in candidates:
-        max_sim = max([np.dot(normalize_l2(candidate[1]), normalize_l2(c[1])) for c in candidates])
-        mmr = mmr_lambda * np.dot(candidate[1], query_vector) - (1 - mmr_lambda) * max_sim
-        candidates_with_mmr.append((candidate[0], mmr))
+) -> list[str]:
+    if len(candidates) == 0:
+        return []
+
+    candidate_uuids = [candidate[0] for candidate in candidates]
+    candidate_embeddings = np.array([candidate[1] for candidate in candidates])
+
+    # Normalize every candidate once and compute all pairwise similarities in one matrix
+    # product, instead of re-normalizing both vectors for each of the n^2 pairs
+    norms = np.linalg.norm(candidate_embeddings, axis=1, keepdims=True)
+    normalized_embeddings = np.divide(
+        candidate_embeddings,
+        norms,
+        out=np.zeros_like(candidate_embeddings, dtype=float),
+        where=norms != 0,
+    )
+    max_sims = (normalized_embeddings @ normalized_embeddings.T).max(axis=1)
+
+    query_sims = candidate_embeddings @ np.array(query_vector)
+    mmr_scores = mmr_lambda * query_sims - (1 - mmr_lambda) * max_sims
 
-    candidates_with_mmr.sort(reverse=True, key=lambda c: c[1])
+    ranked_indices = np.argsort(-mmr_scores, kind='stable')
 
-    return list(set([candidate[0] for candidate in candidates_with_mmr]))
+    # Dedupe while keeping the mmr ordering
+    return list(dict.fromkeys(candidate_uuids[i] for i in ranked_indices))
@@ -417,18 +417,20 @@ async def extract_edge_dates_bulk(
 def chunk_edges_by_nodes(edges: list[EntityEdge]) -> list[list[EntityEdge]]:
     # We only want to dedupe edges that are between the same pair of nodes
     # We build a map of the edges based on their source and target nodes.
-    edge_chunk_map: dict[str, list[EntityEdge]] = defaultdict(list)
+    edge_chunk_map: dict[tuple[str, str], list[EntityEdge]] = defaultdict(list)
     for edge in edges:
         # We drop loop edges
         if edge.source_node_uuid == edge.target_node_uuid:
             continue
 
         # Keep the order of the two nodes consistent, we want to be direction agnostic during edge resolution
-        pointers = [edge.source_node_uuid, edge.target_node_uuid]
-        pointers.sort()
+        if edge.source_node_uuid < edge.target_node_uuid:
+            node_pair = (edge.source_node_uuid, edge.target_node_uuid)
+        else:
+            node_pair = (edge.target_node_uuid, edge.source_node_uuid)
 
-        edge_chunk_map[pointers[0] + pointers[1]].append(edge)
+        edge_chunk_map[node_pair].append(edge)
 
-    edge_chunks = [chunk for chunk in edge_chunk_map.values()]
+    edge_chunks = list(edge_chunk_map.values())
 
     return edge_chunks
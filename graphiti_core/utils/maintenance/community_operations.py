@@ -32,8 +32,6 @@ class Neighbor(BaseModel):
 async def get_community_clusters(
     driver: AsyncDriver, group_ids: list[str] | None
 ) -> list[list[EntityNode]]:
-    community_clusters: list[list[EntityNode]] = []
-
     if group_ids is None:
         group_id_values, _, _ = await driver.execute_query(
             """
@@ -46,36 +44,53 @@ async def get_community_clusters(
 
         group_ids = group_id_values[0]['group_ids']
 
-    for group_id in group_ids:
-        projection: dict[str, list[Neighbor]] = {}
-        nodes = await EntityNode.get_by_group_ids(driver, [group_id])
-        for node in nodes:
-            records, _, _ = await driver.execute_query(
-                """
-            MATCH (n:Entity {group_id: $group_id, uuid: $uuid})-[r:RELATES_TO]-(m: Entity {group_id: $group_id})
-            WITH count(r) AS count, m.uuid AS uuid
-            RETURN
-                uuid,
-                count
-            """,
-                uuid=node.uuid,
-                group_id=group_id,
-                database_=DEFAULT_DATABASE,
-            )
+    async def get_neighbors(node: EntityNode, group_id: str) -> list[Neighbor]:
+        records, _, _ = await driver.execute_query(
+            """
+        MATCH (n:Entity {group_id: $group_id, uuid: $uuid})-[r:RELATES_TO]-(m: Entity {group_id: $group_id})
+        WITH count(r) AS count, m.uuid AS uuid
+        RETURN
+            uuid,
+            count
+        """,
+            uuid=node.uuid,
+            group_id=group_id,
+            database_=DEFAULT_DATABASE,
+        )
+
+        return [
+            Neighbor(node_uuid=record['uuid'], edge_count=record['count']) for record in records
+        ]
+
+    group_nodes: list[list[EntityNode]] = list(
+        await semaphore_gather(
+            *[EntityNode.get_by_group_ids(driver, [group_id]) for group_id in group_ids]
+        )
+    )
 
-            projection[node.uuid] = [
-                Neighbor(node_uuid=record['uuid'], edge_count=record['count']) for record in records
-            ]
+    # Each node's neighborhood is independent, so fetch them all in one bounded gather
+    group_node_pairs = [
+        (group_id, node) for group_id, nodes in zip(group_ids, group_nodes) for node in nodes
+    ]
+    neighbors_list: list[list[Neighbor]] = list(
+        await semaphore_gather(
+            *[get_neighbors(node, group_id) for group_id, node in group_node_pairs]
+        )
+    )
 
-        cluster_uuids = label_propagation(projection)
+    projections: dict[str, dict[str, list[Neighbor]]] = defaultdict(dict)
+    for (group_id, node), neighbors in zip(group_node_pairs, neighbors_list):
+        projections[group_id][node.uuid] = neighbors
 
-        community_clusters.extend(
-            list(
-                await semaphore_gather(
-                    *[EntityNode.get_by_uuids(driver, cluster) for cluster in cluster_uuids]
-                )
-            )
+    cluster_uuids: list[list[str]] = []
+    for projection in projections.values():
+        cluster_uuids.extend(label_propagation(projection))
+
+    community_clusters: list[list[EntityNode]] = list(
+        await semaphore_gather(
+            *[EntityNode.get_by_uuids(driver, cluster) for cluster in cluster_uuids]
         )
+    )
 
     return community_clusters
 
@@ -100,12 +115,12 @@ def label_propagation(projection: dict[str, list[Neighbor]]) -> list[list[str]]:
             for neighbor in neighbors:
                 community_candidates[community_map[neighbor.node_uuid]] += neighbor.edge_count
 
-            community_lst = [
-                (count, community) for community, count in community_candidates.items()
-            ]
-
-            community_lst.sort(reverse=True)
-            community_candidate = community_lst[0][1] if len(community_lst) > 0 else -1
+            # Pick the plurality community, breaking ties by the larger community id
+            community_candidate = max(
+                community_candidates,
+                key=lambda community: (community_candidates[community], community),
+                default=-1,
+            )
 
             new_community = max(community_candidate, curr_community)
 
@@ -123,21 +138,25 @@ def label_propagation(projection: dict[str, list[Neighbor]]) -> list[list[str]]:
     for uuid, community in community_map.items():
         community_cluster_map[community].append(uuid)
 
-    clusters = [cluster for cluster in community_cluster_map.values()]
+    clusters = list(community_cluster_map.values())
     return clusters
 
 
 async def summarize_pair(llm_client: LLMClient, summary_pair: tuple[str, str]) -> str:
+    return await summarize_summaries(llm_client, list(summary_pair))
+
+
+async def summarize_summaries(llm_client: LLMClient, summaries: list[str]) -> str:
     # Prepare context for LLM
-    context = {'node_summaries': [{'summary': summary} for summary in summary_pair]}
+    context = {'node_summaries': [{'summary': summary} for summary in summaries]}
 
     llm_response = await llm_client.generate_response(
         prompt_library.summarize_nodes.summarize_pair(context), response_model=Summary
     )
 
-    pair_summary = llm_response.get('summary', '')
+    combined_summary = llm_response.get('summary', '')
 
-    return pair_summary
+    return combined_summary
 
 
 async def generate_summary_description(llm_client: LLMClient, summary: str) -> str:
@@ -297,21 +316,47 @@ async def determine_entity_community(
 async def update_community(
     driver: AsyncDriver, llm_client: LLMClient, embedder: EmbedderClient, entity: EntityNode
 ):
-    community, is_new = await determine_entity_community(driver, entity)
+    await update_entity_communities(driver, llm_client, embedder, [entity])
+
+
+async def update_entity_communities(
+    driver: AsyncDriver, llm_client: LLMClient, embedder: EmbedderClient, entities: list[EntityNode]
+):
+    community_results = await semaphore_gather(
+        *[determine_entity_community(driver, entity) for entity in entities]
+    )
+
+    # Group the entities by community so each community is summarized with a single LLM call,
+    # rather than once per member entity
+    communities: dict[str, CommunityNode] = {}
+    community_members: dict[str, list[tuple[EntityNode, bool]]] = defaultdict(list)
+    for entity, (community, is_new) in zip(entities, community_results):
+        if community is None:
+            continue
 
-    if community is None:
-        return
+        communities.setdefault(community.uuid, community)
+        community_members[community.uuid].append((entity, is_new))
 
-    new_summary = await summarize_pair(llm_client, (entity.summary, community.summary))
-    new_name = await generate_summary_description(llm_client, new_summary)
+    async def update_single_community(community: CommunityNode):
+        members = community_members[community.uuid]
 
-    community.summary = new_summary
-    community.name = new_name
+        new_summary = await summarize_summaries(
+            llm_client, [entity.summary for entity, _ in members] + [community.summary]
+        )
+        new_name = await generate_summary_description(llm_client, new_summary)
+
+        community.summary = new_summary
+        community.name = new_name
 
-    if is_new:
-        community_edge = (build_community_edges([entity], community, utc_now()))[0]
-        await community_edge.save(driver)
+        new_members = [entity for entity, is_new in members if is_new]
+        if len(new_members) > 0:
+            community_edges = build_community_edges(new_members, community, utc_now())
+            await semaphore_gather(*[edge.save(driver) for edge in community_edges])
 
-    await community.generate_name_embedding(embedder)
+        await community.generate_name_embedding(embedder)
 
-    await community.save(driver)
+        await community.save(driver)
+
+    await semaphore_gather(
+        *[update_single_community(community) for community in communities.values()]
+    )
@@ -120,7 +120,7 @@ async def extract_edges(
             facts_missed = len(missing_facts) != 0
 
     end = time()
-    logger.debug(f'Extracted new edges: {edges_data} in {(end - start) * 1000} ms')
+    logger.debug('Extracted new edges: %s in %s ms', edges_data, (end - start) * 1000)
 
     # Convert the extracted data into EntityEdge objects
     edges = []
@@ -142,7 +142,10 @@ async def extract_edges(
         )
         edges.append(edge)
         logger.debug(
-            f'Created new edge: {edge.name} from (UUID: {edge.source_node_uuid}) to (UUID: {edge.target_node_uuid})'
+            'Created new edge: %s from (UUID: %s) to (UUID: %s)',
+            edge.name,
+            edge.source_node_uuid,
+            edge.target_node_uuid,
         )
 
     return edges
@@ -170,7 +173,7 @@ async def dedupe_extracted_edges(
 
     llm_response = await llm_client.generate_response(prompt_library.dedupe_edges.edge(context))
     duplicate_data = llm_response.get('duplicates', [])
-    logger.debug(f'Extracted unique edges: {duplicate_data}')
+    logger.debug('Extracted unique edges: %s', duplicate_data)
 
     duplicate_uuid_map: dict[str, str] = {}
     for duplicate in duplicate_data:
@@ -308,6 +311,10 @@ async def resolve_extracted_edge(
 async def dedupe_extracted_edge(
     llm_client: LLMClient, extracted_edge: EntityEdge, related_edges: list[EntityEdge]
 ) -> EntityEdge:
+    # Without related edges the extracted edge can't be a duplicate, so skip the LLM call
+    if len(related_edges) == 0:
+        return extracted_edge
+
     start = time()
 
     # Prepare context for LLM
@@ -342,7 +349,7 @@ async def dedupe_extracted_edge(
 
     end = time()
     logger.debug(
-        f'Resolved Edge: {extracted_edge.name} is {edge.name}, in {(end - start) * 1000} ms'
+        'Resolved Edge: %s is %s, in %s ms', extracted_edge.name, edge.name, (end - start) * 1000
     )
 
     return edge
@@ -368,7 +375,7 @@ async def dedupe_edge_list(
     unique_edges_data = llm_response.get('unique_facts', [])
 
     end = time()
-    logger.debug(f'Extracted edge duplicates: {unique_edges_data} in {(end - start) * 1000} ms ')
+    logger.debug('Extracted edge duplicates: %s in %s ms ', unique_edges_data, (end - start) * 1000)
 
     # Get full edge data
     unique_edges = []
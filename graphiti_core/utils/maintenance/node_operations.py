@@ -184,7 +184,7 @@ async def extract_nodes(
             logger.exception(e)
 
     end = time()
-    logger.debug(f'Extracted new nodes: {extracted_node_names} in {(end - start) * 1000} ms')
+    logger.debug('Extracted new nodes: %s in %s ms', extracted_node_names, (end - start) * 1000)
     # Convert the extracted data into EntityNode objects
     new_nodes = []
     for name in extracted_node_names:
@@ -206,7 +206,7 @@ async def extract_nodes(
             created_at=utc_now(),
         )
         new_nodes.append(new_node)
-        logger.debug(f'Created new node: {new_node.name} (UUID: {new_node.uuid})')
+        logger.debug('Created new node: %s (UUID: %s)', new_node.name, new_node.uuid)
 
     return new_nodes
 
@@ -242,7 +242,7 @@ async def dedupe_extracted_nodes(
     duplicate_data = llm_response.get('duplicates', [])
 
     end = time()
-    logger.debug(f'Deduplicated nodes: {duplicate_data} in {(end - start) * 1000} ms')
+    logger.debug('Deduplicated nodes: %s in %s ms', duplicate_data, (end - start) * 1000)
 
     uuid_map: dict[str, str] = {}
     for duplicate in duplicate_data:
@@ -353,16 +353,22 @@ async def resolve_extracted_node(
         __base__=entity_type_classes + (Summary,),  # type: ignore
     )
 
-    llm_response, node_attributes_response = await semaphore_gather(
-        llm_client.generate_response(
-            prompt_library.dedupe_nodes.node(context), response_model=NodeDuplicate
-        ),
-        llm_client.generate_response(
-            prompt_library.summarize_nodes.summarize_context(summary_context),
-            response_model=entity_attributes_model,
-        ),
+    summary_coroutine = llm_client.generate_response(
+        prompt_library.summarize_nodes.summarize_context(summary_context),
+        response_model=entity_attributes_model,
     )
 
+    if len(existing_nodes) > 0:
+        llm_response, node_attributes_response = await semaphore_gather(
+            llm_client.generate_response(
+                prompt_library.dedupe_nodes.node(context), response_model=NodeDuplicate
+            ),
+            summary_coroutine,
+        )
+    else:
+        # There is nothing to dedupe against, so only the summary needs the LLM
+        llm_response, node_attributes_response = {}, await summary_coroutine
+
     extracted_node.summary = node_attributes_response.get('summary', '')
     extracted_node.attributes.update(node_attributes_response)
 
@@ -396,7 +402,7 @@ async def resolve_extracted_node(
 
     end = time()
     logger.debug(
-        f'Resolved node: {extracted_node.name} is {node.name}, in {(end - start) * 1000} ms'
+        'Resolved node: %s is %s, in %s ms', extracted_node.name, node.name, (end - start) * 1000
     )
 
     return node, uuid_map
@@ -429,7 +435,7 @@ async def dedupe_node_list(
     nodes_data = llm_response.get('nodes', [])
 
     end = time()
-    logger.debug(f'Deduplicated nodes: {nodes_data} in {(end - start) * 1000} ms')
+    logger.debug('Deduplicated nodes: %s in %s ms', nodes_data, (end - start) * 1000)
 
     # Get full node data
     unique_nodes = []
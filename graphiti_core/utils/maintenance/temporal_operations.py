@@ -71,6 +71,10 @@ async def extract_edge_dates(
 async def get_edge_contradictions(
     llm_client: LLMClient, new_edge: EntityEdge, existing_edges: list[EntityEdge]
 ) -> list[EntityEdge]:
+    # Without existing edges there is nothing to contradict, so skip the LLM call
+    if len(existing_edges) == 0:
+        return []
+
     start = time()
     existing_edge_map = {edge.uuid: edge for edge in existing_edges}
 
@@ -97,7 +101,7 @@ async def get_edge_contradictions(
 
     end = time()
     logger.debug(
-        f'Found invalidated edge candidates from {new_edge.fact}, in {(end - start) * 1000} ms'
+        'Found invalidated edge candidates from %s, in %s ms', new_edge.fact, (end - start) * 1000
     )
 
     return contradicted_edges
@@ -9,12 +9,12 @@ from graph_service.zep_graphiti import initialize_graphiti
 
 
 @asynccontextmanager
-async def lifespan(_: FastAPI):
+async def lifespan(app: FastAPI):
     settings = get_settings()
-    await initialize_graphiti(settings)
+    app.state.graphiti = await initialize_graphiti(settings)
     yield
     # Shutdown
-    # No need to close Graphiti here, as it's handled per-request
+    await app.state.graphiti.close()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -1,14 +1,14 @@
 import logging
 from typing import Annotated
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Request
 from graphiti_core import Graphiti  # type: ignore
 from graphiti_core.edges import EntityEdge  # type: ignore
 from graphiti_core.errors import EdgeNotFoundError, GroupsEdgesNotFoundError, NodeNotFoundError
 from graphiti_core.llm_client import LLMClient  # type: ignore
 from graphiti_core.nodes import EntityNode, EpisodicNode  # type: ignore
 
-from graph_service.config import ZepEnvDep
+from graph_service.config import Settings
 from graph_service.dto import FactResult
 
 logger = logging.getLogger(__name__)
@@ -71,7 +71,7 @@ class ZepGraphiti(Graphiti):
             raise HTTPException(status_code=404, detail=e.message) from e
 
 
-async def get_graphiti(settings: ZepEnvDep):
+def create_graphiti(settings: Settings) -> ZepGraphiti:
     client = ZepGraphiti(
         uri=settings.neo4j_uri,
         user=settings.neo4j_user,
@@ -84,19 +84,19 @@ async def get_graphiti(settings: ZepEnvDep):
     if settings.model_name is not None:
         client.llm_client.model = settings.model_name
 
-    try:
-        yield client
-    finally:
-        await client.close()
+    return client
 
 
-async def initialize_graphiti(settings: ZepEnvDep):
-    client = ZepGraphiti(
-        uri=settings.neo4j_uri,
-        user=settings.neo4j_user,
-        password=settings.neo4j_password,
-    )
+async def initialize_graphiti(settings: Settings) -> ZepGraphiti:
+    client = create_graphiti(settings)
     await client.build_indices_and_constraints()
+    return client
+
+
+async def get_graphiti(request: Request) -> ZepGraphiti:
+    # A single client is shared by all requests so they reuse its Neo4j connection pool,
+    # and queued ingestion jobs never outlive the client they were given
+    return request.app.state.graphiti
 
 
 def get_fact_result_from_edge(edge: EntityEdge):
@@ -0,0 +1,70 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+from graphiti_core.llm_client.anthropic_client import AnthropicClient
+from graphiti_core.llm_client.config import LLMConfig
+from graphiti_core.prompts.models import Message
+
+
+class ExtractedFact(BaseModel):
+    fact: str
+
+
+@pytest.fixture
+def anthropic_client():
+    return AnthropicClient(LLMConfig(api_key='test_key'))
+
+
+@pytest.fixture
+def messages():
+    return [
+        Message(role='system', content='You are a helpful assistant.'),
+        Message(role='user', content='Extract the fact.'),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_generate_response_returns_tool_use_input(anthropic_client, messages):
+    text_block = MagicMock(type='text')
+    tool_use_block = MagicMock(type='tool_use', input={'fact': 'Alice knows Bob'})
+    anthropic_client.client.messages.create = AsyncMock(
+        return_value=MagicMock(content=[text_block, tool_use_block])
+    )
+
+    response = await anthropic_client.generate_response(messages, response_model=ExtractedFact)
+
+    assert response == {'fact': 'Alice knows Bob'}
+    call_kwargs = anthropic_client.client.messages.create.call_args.kwargs
+    assert call_kwargs['tools'][0]['name'] == 'ExtractedFact'
+    assert call_kwargs['tools'][0]['input_schema'] == ExtractedFact.model_json_schema()
+    assert call_kwargs['tool_choice'] == {'type': 'tool', 'name': 'ExtractedFact'}
+    # The schema is passed as the tool's input schema, so it is not appended to the prompt
+    assert 'Respond with a JSON object' not in messages[-1].content
+
+
+@pytest.mark.asyncio
+async def test_generate_response_raises_without_tool_use_block(anthropic_client, messages):
+    anthropic_client.client.messages.create = AsyncMock(
+        return_value=MagicMock(content=[MagicMock(type='text')])
+    )
+
+    with pytest.raises(Exception, match='Invalid response from LLM'):
+        await anthropic_client.generate_response(messages, response_model=ExtractedFact)
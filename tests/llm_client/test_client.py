@@ -14,8 +14,11 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+from pydantic import BaseModel
+
 from graphiti_core.llm_client.client import LLMClient
 from graphiti_core.llm_client.config import LLMConfig
+from graphiti_core.prompts.models import Message
 
 
 class TestLLMClient(LLMClient):
@@ -55,3 +58,18 @@ def test_clean_input():
 
     for input_str, expected in test_cases:
         assert client._clean_input(input_str) == expected, f'Failed for input: {repr(input_str)}'
+
+
+def test_cache_key_depends_on_response_model():
+    class Summary(BaseModel):
+        summary: str
+
+    class Fact(BaseModel):
+        fact: str
+
+    client = TestLLMClient(LLMConfig())
+    messages = [Message(role='user', content='Hello World')]
+
+    assert client._get_cache_key(messages, Summary) == client._get_cache_key(messages, Summary)
+    assert client._get_cache_key(messages, Summary) != client._get_cache_key(messages, Fact)
+    assert client._get_cache_key(messages, Summary) != client._get_cache_key(messages)
@@ -0,0 +1,48 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+
+import pytest
+
+from graphiti_core.llm_client.utils import parse_json_response
+
+
+def test_parse_json_response_valid():
+    assert parse_json_response('{"a": 1, "b": [1, 2]}') == {'a': 1, 'b': [1, 2]}
+
+
+def test_parse_json_response_repairs_common_mistakes():
+    # Markdown code fences
+    assert parse_json_response('```json\n{"a": 1}\n```') == {'a': 1}
+    # Prose around the JSON object
+    assert parse_json_response('Here is the result: {"a": 1} Hope this helps!') == {'a': 1}
+    # Trailing commas
+    assert parse_json_response('{"a": [1, 2,], "b": 2,}') == {'a': [1, 2], 'b': 2}
+
+
+def test_parse_json_response_keeps_commas_inside_strings():
+    # Only trailing commas outside of string literals are removed during repair
+    assert parse_json_response('{"fact": "lists like [a, b, ] are fine", "x": [1,],}') == {
+        'fact': 'lists like [a, b, ] are fine',
+        'x': [1],
+    }
+    assert parse_json_response('{"fact": "say \\"a, }\\" to b",}') == {'fact': 'say "a, }" to b'}
+
+
+def test_parse_json_response_raises_when_unrepairable():
+    with pytest.raises(json.JSONDecodeError):
+        parse_json_response('{"a": ')
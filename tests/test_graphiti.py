@@ -0,0 +1,169 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from graphiti_core.edges import EntityEdge
+from graphiti_core.graphiti import Graphiti
+from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode
+from graphiti_core.search.search_cache import SearchCache
+from graphiti_core.search.search_config import SearchResults
+from graphiti_core.search.search_config_recipes import EDGE_HYBRID_SEARCH_RRF
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.utils.datetime_utils import utc_now
+
+
+@pytest.fixture
+def graphiti():
+    with patch('graphiti_core.graphiti.AsyncGraphDatabase'):
+        return Graphiti(
+            'bolt://localhost:7687',
+            'neo4j',
+            'password',
+            llm_client=MagicMock(),
+            embedder=MagicMock(),
+            cross_encoder=MagicMock(),
+            search_cache=SearchCache(),
+        )
+
+
+def make_search_results() -> SearchResults:
+    edge = EntityEdge(
+        source_node_uuid='alice_uuid',
+        target_node_uuid='bob_uuid',
+        name='KNOWS',
+        group_id='group_1',
+        fact='Alice knows Bob',
+        episodes=['episode_1'],
+        created_at=utc_now(),
+    )
+    node = EntityNode(name='Alice', group_id='group_1')
+    return SearchResults(edges=[edge], nodes=[node], communities=[])
+
+
+@pytest.mark.asyncio
+async def test_search_results_are_cached_until_graph_changes(graphiti):
+    with patch(
+        'graphiti_core.graphiti.search', AsyncMock(side_effect=lambda *args: make_search_results())
+    ) as search_mock:
+        await graphiti._search('Who does Alice know?', EDGE_HYBRID_SEARCH_RRF)
+        await graphiti._search('Who does Alice know?', EDGE_HYBRID_SEARCH_RRF)
+        assert search_mock.call_count == 1
+
+        # Writes bump the graph version, which invalidates cached results
+        graphiti._increment_graph_version()
+        await graphiti._search('Who does Alice know?', EDGE_HYBRID_SEARCH_RRF)
+        assert search_mock.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_search_results_are_not_shared_with_callers(graphiti):
+    with patch(
+        'graphiti_core.graphiti.search', AsyncMock(side_effect=lambda *args: make_search_results())
+    ) as search_mock:
+        first = await graphiti._search('Who does Alice know?', EDGE_HYBRID_SEARCH_RRF)
+        first.edges[0].fact = 'Alice forgot Bob'
+        first.edges.clear()
+
+        second = await graphiti._search('Who does Alice know?', EDGE_HYBRID_SEARCH_RRF)
+        assert [edge.fact for edge in second.edges] == ['Alice knows Bob']
+        second.edges[0].fact = 'Alice forgot Bob'
+        second.edges.clear()
+
+        third = await graphiti._search('Who does Alice know?', EDGE_HYBRID_SEARCH_RRF)
+        assert [edge.fact for edge in third.edges] == ['Alice knows Bob']
+        assert search_mock.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_search_reads_through_the_cache(graphiti):
+    with patch(
+        'graphiti_core.graphiti.search', AsyncMock(side_effect=lambda *args: make_search_results())
+    ) as search_mock:
+        first = await graphiti.search('Who does Alice know?')
+        first[0].fact = 'Alice forgot Bob'
+        first.clear()
+
+        # A missing search filter is normalized, so it shares the entry of an empty one
+        second = await graphiti.search('Who does Alice know?', search_filter=SearchFilters())
+        assert [edge.fact for edge in second] == ['Alice knows Bob']
+        second[0].fact = 'Alice forgot Bob'
+
+        third = await graphiti.search('Who does Alice know?')
+        assert [edge.fact for edge in third] == ['Alice knows Bob']
+        assert search_mock.call_count == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'num_results': 5},
+        {'center_node_uuid': 'alice_uuid'},
+        {'search_filter': SearchFilters(node_labels=['Person'])},
+        {'group_ids': ['group_2']},
+    ],
+)
+async def test_search_cache_misses_on_different_arguments(graphiti, kwargs):
+    with patch(
+        'graphiti_core.graphiti.search', AsyncMock(side_effect=lambda *args: make_search_results())
+    ) as search_mock:
+        await graphiti.search('Who does Alice know?')
+        await graphiti.search('Who does Alice know?', **kwargs)
+
+        assert search_mock.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_episode_lookups_are_cached_until_graph_changes(graphiti):
+    search_results = make_search_results()
+    episode = EpisodicNode(
+        name='Episode',
+        group_id='group_1',
+        source=EpisodeType.message,
+        source_description='Test episode',
+        content='Alice knows Bob',
+        valid_at=utc_now(),
+        entity_edges=[search_results.edges[0].uuid],
+    )
+
+    with (
+        patch.object(EpisodicNode, 'get_by_uuids', AsyncMock(return_value=[episode])),
+        patch.object(
+            EntityEdge,
+            'get_by_uuids',
+            AsyncMock(side_effect=lambda *args: make_search_results().edges),
+        ) as get_edges_mock,
+        patch(
+            'graphiti_core.graphiti.get_mentioned_nodes',
+            AsyncMock(side_effect=lambda *args: make_search_results().nodes),
+        ),
+    ):
+        first = await graphiti.get_nodes_and_edges_by_episode([episode.uuid])
+        first.edges[0].fact = 'Alice forgot Bob'
+        first.nodes.clear()
+
+        second = await graphiti.get_nodes_and_edges_by_episode([episode.uuid])
+        assert [edge.fact for edge in second.edges] == ['Alice knows Bob']
+        assert [node.name for node in second.nodes] == ['Alice']
+        assert get_edges_mock.call_count == 1
+
+        # Writes bump the graph version, which invalidates cached results
+        graphiti._increment_graph_version()
+        await graphiti.get_nodes_and_edges_by_episode([episode.uuid])
+        assert get_edges_mock.call_count == 2
@@ -0,0 +1,51 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from graphiti_core.nodes import CommunityNode, EntityNode
+from graphiti_core.utils.maintenance.community_operations import update_entity_communities
+
+
+@pytest.mark.asyncio
+async def test_update_entity_communities_summarizes_shared_community_once():
+    community = CommunityNode(name='People', group_id='group_1', summary='Community summary')
+    alice = EntityNode(name='Alice', group_id='group_1', summary='Alice summary')
+    bob = EntityNode(name='Bob', group_id='group_1', summary='Bob summary')
+
+    module = 'graphiti_core.utils.maintenance.community_operations'
+    with (
+        patch(
+            f'{module}.determine_entity_community',
+            AsyncMock(return_value=(community, False)),
+        ),
+        patch(
+            f'{module}.summarize_summaries', AsyncMock(return_value='New summary')
+        ) as summarize_mock,
+        patch(f'{module}.generate_summary_description', AsyncMock(return_value='New name')),
+        patch.object(CommunityNode, 'generate_name_embedding', AsyncMock()),
+        patch.object(CommunityNode, 'save', AsyncMock()) as save_mock,
+    ):
+        await update_entity_communities(MagicMock(), MagicMock(), MagicMock(), [alice, bob])
+
+    summarize_mock.assert_called_once()
+    summaries = summarize_mock.call_args.args[1]
+    assert sorted(summaries) == sorted(['Alice summary', 'Bob summary', 'Community summary'])
+    save_mock.assert_called_once()
+    assert community.summary == 'New summary'
+    assert community.name == 'New name'
@@ -6,7 +6,10 @@ from pytest import MonkeyPatch
 
 from graphiti_core.edges import EntityEdge
 from graphiti_core.nodes import EpisodicNode
-from graphiti_core.utils.maintenance.edge_operations import resolve_extracted_edge
+from graphiti_core.utils.maintenance.edge_operations import (
+    dedupe_extracted_edge,
+    resolve_extracted_edge,
+)
 
 
 @pytest.fixture
@@ -237,6 +240,17 @@ async def test_resolve_extracted_edge_with_invalidation(
     assert invalidated_edges[0].expired_at is not None
 
 
+@pytest.mark.asyncio
+async def test_dedupe_extracted_edge_skips_llm_without_related_edges(mock_extracted_edge):
+    llm_client = MagicMock()
+    llm_client.generate_response = AsyncMock()
+
+    resolved_edge = await dedupe_extracted_edge(llm_client, mock_extracted_edge, [])
+
+    assert resolved_edge is mock_extracted_edge
+    llm_client.generate_response.assert_not_called()
+
+
 # Run the tests
 if __name__ == '__main__':
     pytest.main([__file__])
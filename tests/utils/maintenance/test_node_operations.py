@@ -0,0 +1,40 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.nodes import EntityNode
+from graphiti_core.utils.maintenance.node_operations import resolve_extracted_node
+
+
+@pytest.mark.asyncio
+async def test_resolve_extracted_node_only_summarizes_without_existing_nodes():
+    llm_client = MagicMock()
+    llm_client.generate_response = AsyncMock(return_value={'summary': 'Alice is an engineer'})
+    extracted_node = EntityNode(name='Alice', group_id='group_1', labels=['Entity'])
+
+    node, uuid_map = await resolve_extracted_node(llm_client, extracted_node, [])
+
+    # Only the summary prompt is sent, there is nothing to dedupe against
+    llm_client.generate_response.assert_called_once()
+    assert llm_client.generate_response.call_args.kwargs['response_model'].__name__ == (
+        'EntityAttributes'
+    )
+    assert node is extracted_node
+    assert node.summary == 'Alice is an engineer'
+    assert uuid_map == {}
@@ -0,0 +1,42 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.edges import EntityEdge
+from graphiti_core.utils.datetime_utils import utc_now
+from graphiti_core.utils.maintenance.temporal_operations import get_edge_contradictions
+
+
+@pytest.mark.asyncio
+async def test_get_edge_contradictions_skips_llm_without_existing_edges():
+    llm_client = MagicMock()
+    llm_client.generate_response = AsyncMock()
+    new_edge = EntityEdge(
+        source_node_uuid='1',
+        target_node_uuid='2',
+        name='DISLIKES',
+        fact='Alice dislikes Bob',
+        created_at=utc_now(),
+        group_id='1',
+    )
+
+    contradicted_edges = await get_edge_contradictions(llm_client, new_edge, [])
+
+    assert contradicted_edges == []
+    llm_client.generate_response.assert_not_called()
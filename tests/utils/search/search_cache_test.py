@@ -0,0 +1,45 @@
+from unittest.mock import patch
+
+from graphiti_core.search.search_cache import SearchCache
+
+
+def test_search_cache_get_and_set():
+    cache = SearchCache()
+
+    assert cache.get('missing') is None
+
+    cache.set('query', ['a', 'b'])
+    assert cache.get('query') == ['a', 'b']
+
+    cache.clear()
+    assert cache.get('query') is None
+
+
+def test_search_cache_evicts_least_recently_used():
+    cache = SearchCache(max_size=2)
+
+    cache.set('first', [1])
+    cache.set('second', [2])
+    # Touch the first entry so the second becomes the least recently used
+    assert cache.get('first') == [1]
+    cache.set('third', [3])
+
+    assert len(cache) == 2
+    assert cache.get('second') is None
+    assert cache.get('first') == [1]
+    assert cache.get('third') == [3]
+
+
+def test_search_cache_expires_entries():
+    cache = SearchCache(ttl=10)
+
+    with patch('graphiti_core.search.search_cache.monotonic') as mock_monotonic:
+        mock_monotonic.return_value = 100.0
+        cache.set('query', ['a'])
+
+        mock_monotonic.return_value = 105.0
+        assert cache.get('query') == ['a']
+
+        mock_monotonic.return_value = 111.0
+        assert cache.get('query') is None
+        assert len(cache) == 0
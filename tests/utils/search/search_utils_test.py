@@ -4,7 +4,7 @@ import pytest
 
 from graphiti_core.nodes import EntityNode
 from graphiti_core.search.search_filters import SearchFilters
-from graphiti_core.search.search_utils import hybrid_node_search
+from graphiti_core.search.search_utils import hybrid_node_search, maximal_marginal_relevance
 
 
 @pytest.mark.asyncio
@@ -166,3 +166,21 @@ async def test_hybrid_node_search_with_limit_and_duplicates():
         mock_similarity_search.assert_called_with(
             mock_driver, [0.1, 0.2, 0.3], SearchFilters(), ['1'], 4
         )
+
+
+def test_maximal_marginal_relevance():
+    query_vector = [1.0, 0.0]
+    candidates = [
+        ('orthogonal', [0.0, 1.0]),
+        ('aligned', [1.0, 0.0]),
+        ('partial', [0.6, 0.8]),
+        ('aligned', [1.0, 0.0]),
+    ]
+
+    # Results are ordered by relevance to the query and deduplicated
+    assert maximal_marginal_relevance(query_vector, candidates) == [
+        'aligned',
+        'partial',
+        'orthogonal',
+    ]
+    assert maximal_marginal_relevance(query_vector, []) == []